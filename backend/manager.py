@@ -3,14 +3,22 @@
 from __future__ import annotations
 
 from pathlib import Path
-from threading import RLock
-from typing import Callable, Dict, Iterable, List, Optional
+from threading import Lock, RLock, Timer
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from PySide6.QtCore import QObject, Qt, Signal
 
 from .models import ProcessState, ProcessStatus, ScriptProfile
 from .process_runner import ProcessRunner
 from .profile_store import ProfileStore
 
 
+class _StatusEmitter(QObject):
+    """Carry status updates from runner threads to the thread owning the manager."""
+
+    statusChanged = Signal(object)
+
+
 class ScriptManager:
     """Manage script profiles and their supervised processes."""
 
@@ -19,11 +27,25 @@ class ScriptManager:
         store: Optional[ProfileStore] = None,
     ) -> None:
         self.store = store or ProfileStore()
-        self._lock = RLock()
+        # Mutators replace these dicts wholesale under the write lock, so readers
+        # can use whichever snapshot is current without locking. The lock must
+        # stay reentrant: add/update/remove hold it while calling _mark_dirty(),
+        # which takes it again.
+        self._write_lock = RLock()
         self._profiles: Dict[str, ScriptProfile] = {}
         self._runners: Dict[str, ProcessRunner] = {}
+        # Holds each runner's own status object, so runner updates need no write here.
         self._statuses: Dict[str, ProcessStatus] = {}
-        self._listeners: List[Callable[[ProcessStatus], None]] = []
+        # Listeners are invoked through Qt's event queue, so runners never wait on them.
+        self._emitter = _StatusEmitter()
+        # Resource usage is sampled for all runners in one sweep (normally by
+        # the UI's sampler thread); cached_usage() only reads the last sweep.
+        self._usage_cache: Dict[str, Dict[str, float | int | None]] = {}
+        # Profile writes are debounced; flush() forces pending changes to disk.
+        self._dirty = False
+        self._save_timer: Optional[Timer] = None
+        self._save_delay = 0.5
+        self._save_lock = Lock()
         self._load_initial_profiles()
 
     # ------------------------------------------------------------------
@@ -35,89 +57,167 @@ class ScriptManager:
             self._register_profile(profile)
 
     def save(self) -> None:
-        with self._lock:
-            self.store.save_profiles(self._profiles.values())
+        with self._write_lock:
+            self._dirty = True
+        self.flush()
+
+    def flush(self) -> None:
+        """Write pending profile changes to disk now."""
+        # The save lock keeps concurrent flushes in order without blocking mutators.
+        with self._save_lock:
+            with self._write_lock:
+                if self._save_timer:
+                    self._save_timer.cancel()
+                    self._save_timer = None
+                if not self._dirty:
+                    return
+                self._dirty = False
+                profiles = list(self._profiles.values())
+            self.store.save_profiles(profiles)
+
+    def _mark_dirty(self) -> None:
+        with self._write_lock:
+            self._dirty = True
+            if self._save_timer:
+                self._save_timer.cancel()
+            self._save_timer = Timer(self._save_delay, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
 
     def register_listener(self, callback: Callable[[ProcessStatus], None]) -> None:
-        self._listeners.append(callback)
+        self._emitter.statusChanged.connect(callback, Qt.QueuedConnection)
 
     def _on_runner_update(self, status: ProcessStatus) -> None:
-        with self._lock:
-            self._statuses[status.name] = status
-        for listener in self._listeners:
-            listener(status)
+        if status.name not in self._statuses:
+            # Late update from a runner whose profile has been removed.
+            return
+        # Runners mutate their status in place; hand listeners a snapshot.
+        self._emitter.statusChanged.emit(status.snapshot())
 
     # ------------------------------------------------------------------
     # Profile management
     # ------------------------------------------------------------------
     def get_profiles(self) -> List[ScriptProfile]:
-        with self._lock:
-            return list(self._profiles.values())
+        return list(self._profiles.values())
+
+    def get_profile(self, name: str) -> Optional[ScriptProfile]:
+        return self._profiles.get(name)
 
     def add_profile(self, profile: ScriptProfile) -> None:
-        with self._lock:
+        with self._write_lock:
             if profile.name in self._profiles:
                 raise ValueError(f"Profile '{profile.name}' already exists")
             self._register_profile(profile)
-            self.save()
+            self._mark_dirty()
+
+    def add_profiles(self, profiles: Iterable[ScriptProfile]) -> None:
+        """Add several profiles at once.
+
+        Nothing is added if any name clashes or any log directory cannot be
+        created. The maps are rebuilt once for the whole batch.
+        """
+        profiles = list(profiles)
+        with self._write_lock:
+            seen = set(self._profiles)
+            for profile in profiles:
+                if profile.name in seen:
+                    raise ValueError(f"Profile '{profile.name}' already exists")
+                seen.add(profile.name)
+            runners = {}
+            for profile in profiles:
+                profile.ensure_paths(self.store.base_dir)
+                runners[profile.name] = ProcessRunner(profile, status_callback=self._on_runner_update)
+            self._profiles = {**self._profiles, **{profile.name: profile for profile in profiles}}
+            self._statuses = {**self._statuses, **{name: runner.status for name, runner in runners.items()}}
+            self._runners = {**self._runners, **runners}
+            self._mark_dirty()
 
     def update_profile(self, name: str, new_profile: ScriptProfile) -> None:
-        with self._lock:
+        with self._write_lock:
             if name not in self._profiles:
                 raise KeyError(f"Profile '{name}' not found")
             if new_profile.name != name and new_profile.name in self._profiles:
                 raise ValueError(f"Profile '{new_profile.name}' already exists")
             runner = self._runners.get(name)
+            if runner and new_profile.name == name and new_profile.enabled:
+                new_profile.ensure_paths(self.store.base_dir)
+                if not self._requires_new_runner(runner.profile, new_profile):
+                    # Settings the runner reads on each cycle; no restart needed.
+                    runner.profile = new_profile
+                    self._profiles = {**self._profiles, name: new_profile}
+                    self._mark_dirty()
+                    return
             was_running = runner.is_running() if runner else False
             if runner:
                 runner.stop(force=False)
-            self._profiles.pop(name)
-            self._statuses.pop(name, None)
-            self._runners.pop(name, None)
-            self._register_profile(new_profile)
+            self._register_profile(new_profile, replaces=name)
             if was_running and new_profile.enabled:
                 self.start_profile(new_profile.name)
-            self.save()
+            self._mark_dirty()
 
     def remove_profile(self, name: str) -> None:
-        with self._lock:
-            runner = self._runners.pop(name, None)
+        with self._write_lock:
+            runner = self._runners.get(name)
             if runner:
                 runner.stop(force=False)
-            self._profiles.pop(name, None)
-            self._statuses.pop(name, None)
-            self.save()
+            self._unregister_profile(name)
+            self._mark_dirty()
 
-    def _register_profile(self, profile: ScriptProfile) -> None:
+    @staticmethod
+    def _requires_new_runner(old: ScriptProfile, new: ScriptProfile) -> bool:
+        """Return True if *new* changes how the process itself is launched."""
+        return (
+            old.script_path != new.script_path
+            or old.working_dir != new.working_dir
+            or old.environment != new.environment
+            or old.log_path != new.log_path
+        )
+
+    def _register_profile(self, profile: ScriptProfile, replaces: Optional[str] = None) -> None:
+        """Register *profile*, taking the position of *replaces* if given."""
         profile.ensure_paths(self.store.base_dir)
-        self._profiles[profile.name] = profile
-        status = ProcessStatus(name=profile.name)
-        self._statuses[profile.name] = status
         runner = ProcessRunner(profile, status_callback=self._on_runner_update)
-        self._runners[profile.name] = runner
+        if replaces is None:
+            self._profiles = {**self._profiles, profile.name: profile}
+            self._statuses = {**self._statuses, profile.name: runner.status}
+            self._runners = {**self._runners, profile.name: runner}
+            return
+        # Keep the edited profile where it was so the table rows do not move.
+        self._profiles = self._replaced(self._profiles, replaces, profile.name, profile)
+        self._statuses = self._replaced(self._statuses, replaces, profile.name, runner.status)
+        self._runners = self._replaced(self._runners, replaces, profile.name, runner)
+
+    @staticmethod
+    def _replaced(mapping: Dict, old_key: str, new_key: str, value: object) -> Dict:
+        return {
+            (new_key if key == old_key else key): (value if key == old_key else item)
+            for key, item in mapping.items()
+        }
+
+    def _unregister_profile(self, name: str) -> None:
+        self._profiles = {key: value for key, value in self._profiles.items() if key != name}
+        self._statuses = {key: value for key, value in self._statuses.items() if key != name}
+        self._runners = {key: value for key, value in self._runners.items() if key != name}
 
     # ------------------------------------------------------------------
     # Process control
     # ------------------------------------------------------------------
     def start_profile(self, name: str) -> None:
-        with self._lock:
-            profile = self._profiles.get(name)
-            if not profile or not profile.enabled:
-                return
-            runner = self._runners[name]
-            runner.start()
+        profile = self._profiles.get(name)
+        runner = self._runners.get(name)
+        if not profile or not profile.enabled or not runner:
+            return
+        runner.start()
 
     def stop_profile(self, name: str, force: bool = False) -> None:
-        with self._lock:
-            runner = self._runners.get(name)
-            if runner:
-                runner.stop(force=force)
+        runner = self._runners.get(name)
+        if runner:
+            runner.stop(force=force)
 
     def restart_profile(self, name: str) -> None:
-        with self._lock:
-            runner = self._runners.get(name)
-            if runner:
-                runner.restart()
+        runner = self._runners.get(name)
+        if runner:
+            runner.restart()
 
     def start_auto_profiles(self) -> None:
         for profile in self.get_profiles():
@@ -127,24 +227,35 @@ class ScriptManager:
     def stop_all(self) -> None:
         for name in list(self._runners.keys()):
             self.stop_profile(name)
+        self.flush()
 
     # ------------------------------------------------------------------
     # Status and monitoring
     # ------------------------------------------------------------------
     def get_status(self, name: str) -> Optional[ProcessStatus]:
-        with self._lock:
-            return self._statuses.get(name)
+        return self._statuses.get(name)
 
     def list_statuses(self) -> List[ProcessStatus]:
-        with self._lock:
-            return list(self._statuses.values())
+        return list(self._statuses.values())
 
-    def get_resource_usage(self, name: str) -> Dict[str, float | int | None]:
-        with self._lock:
-            runner = self._runners.get(name)
-        if not runner:
-            return {"cpu_percent": None, "memory_mb": None}
-        return runner.get_resource_usage()
+    def snapshot(self) -> Dict[str, Tuple[ScriptProfile, ProcessStatus, Dict[str, float | int | None]]]:
+        """Return profile, status and resource usage for every profile in one pass."""
+        profiles = self._profiles
+        statuses = self._statuses
+        return {
+            name: (profile, statuses.get(name) or ProcessStatus(name=name), self.cached_usage(name))
+            for name, profile in profiles.items()
+        }
+
+    def sample_all(self) -> Dict[str, Dict[str, float | int | None]]:
+        """Sample resource usage of every runner in one sweep and cache the result."""
+        usage = {key: runner.get_resource_usage() for key, runner in self._runners.items()}
+        self._usage_cache = usage
+        return usage
+
+    def cached_usage(self, name: str) -> Dict[str, float | int | None]:
+        """Return usage from the last sweep without sampling, for GUI-thread reads."""
+        return self._usage_cache.get(name, {"cpu_percent": None, "memory_mb": None})
 
     def ensure_log_directory(self) -> Path:
         logs_dir = self.store.base_dir / "logs"
@@ -2,10 +2,42 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict
+import json
+from dataclasses import dataclass, field, fields, replace
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Set, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+# Directories already created by this process; skips redundant mkdir calls.
+_KNOWN_DIRS: Set[Path] = set()
+
+
+def encode_json(data: object, indent: bool = True) -> bytes:
+    """Encode *data* as UTF-8 JSON (indented or compact), using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2) if indent else orjson.dumps(data)
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def decode_json(raw: bytes) -> object:
+    """Decode UTF-8 JSON bytes without an intermediate ``str``."""
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError.
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _ensure_dir(path: Path) -> None:
+    if path not in _KNOWN_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _KNOWN_DIRS.add(path)
 
 
 class ProcessState(str, Enum):
@@ -19,7 +51,7 @@ class ProcessState(str, Enum):
     FAILED = "failed"
 
 
-@dataclass
+@dataclass(slots=True)
 class ScriptProfile:
     """Configuration profile for a script run."""
 
@@ -34,10 +66,53 @@ class ScriptProfile:
     log_path: Optional[str] = None
     max_restarts: Optional[int] = None
     enabled: bool = True
+    _cached_dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    _env_text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _delay_text: Optional[Tuple[str, str]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Any field assignment invalidates the memoized serialized forms.
+        if not name.startswith("_"):
+            object.__setattr__(self, "_cached_dict", None)
+            if name == "environment":
+                object.__setattr__(self, "_env_text", None)
+            elif name in ("restart_delay", "start_delay"):
+                object.__setattr__(self, "_delay_text", None)
+        object.__setattr__(self, name, value)
+
+    @property
+    def env_text(self) -> str:
+        """Environment as ``KEY=value`` lines, reused until it is reassigned."""
+        if self._env_text is None:
+            self._env_text = "\n".join(f"{key}={value}" for key, value in self.environment.items())
+        return self._env_text
+
+    @property
+    def restart_delay_text(self) -> str:
+        """``restart_delay`` formatted for display (one decimal place)."""
+        return self._delays_formatted()[0]
+
+    @property
+    def start_delay_text(self) -> str:
+        """``start_delay`` formatted for display (one decimal place)."""
+        return self._delays_formatted()[1]
+
+    def _delays_formatted(self) -> Tuple[str, str]:
+        if self._delay_text is None:
+            self._delay_text = (f"{self.restart_delay:.1f}", f"{self.start_delay:.1f}")
+        return self._delay_text
 
     def to_dict(self) -> Dict[str, Any]:
-        data = asdict(self)
-        return data
+        """Return a copy of the serialized form.
+
+        The form itself is memoized until a field is reassigned, so edit
+        ``environment`` by assigning a new dict rather than in place.
+        """
+        if self._cached_dict is None:
+            data = {name: getattr(self, name) for name in _PROFILE_FIELDS}
+            data["environment"] = dict(self.environment)
+            self._cached_dict = data
+        return {**self._cached_dict, "environment": dict(self._cached_dict["environment"])}
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ScriptProfile":
@@ -47,14 +122,18 @@ class ScriptProfile:
         """Ensure paths like log directory exist."""
         if not self.log_path:
             logs_dir = base_dir / "logs"
-            logs_dir.mkdir(parents=True, exist_ok=True)
+            _ensure_dir(logs_dir)
             safe_name = self.name.replace(" ", "_")
             self.log_path = str(logs_dir / f"{safe_name}.log")
         else:
-            Path(self.log_path).parent.mkdir(parents=True, exist_ok=True)
+            _ensure_dir(Path(self.log_path).parent)
+
 
+# Serialized field names, resolved once instead of walking fields() per call.
+_PROFILE_FIELDS = tuple(item.name for item in fields(ScriptProfile) if not item.name.startswith("_"))
 
-@dataclass
+
+@dataclass(slots=True)
 class ProcessStatus:
     """Runtime status for a managed script."""
 
@@ -65,6 +144,25 @@ class ProcessStatus:
     restarts: int = 0
     last_exit_code: Optional[int] = None
     last_error: Optional[str] = None
+    _json: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    _snapshot: bool = field(default=False, init=False, repr=False, compare=False)
+
+    def snapshot(self) -> "ProcessStatus":
+        """Return a copy that is never mutated, so its encoding can be memoized."""
+        copy = replace(self)
+        copy._snapshot = True
+        return copy
+
+    def as_json(self) -> bytes:
+        """Return the compact JSON encoding, memoized on snapshots only.
+
+        Runners update their live status in place, so it is encoded afresh.
+        """
+        if not self._snapshot:
+            return encode_json(self.to_dict(), indent=False)
+        if self._json is None:
+            self._json = encode_json(self.to_dict(), indent=False)
+        return self._json
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -14,6 +14,15 @@ import psutil
 
 from .models import ProcessState, ProcessStatus, ScriptProfile
 
+# Inherited environment, captured once and shared read-only by all runners.
+_BASE_ENV: Dict[str, str] = dict(os.environ)
+
+
+def refresh_base_env() -> None:
+    """Re-capture os.environ for runners created or refreshed afterwards."""
+    global _BASE_ENV  # pylint: disable=global-statement
+    _BASE_ENV = dict(os.environ)
+
 
 class ProcessRunner:
     """Manage the lifecycle of a configured script process."""
@@ -28,9 +37,11 @@ class ProcessRunner:
         self._status_callback = status_callback
         self._thread: Optional[threading.Thread] = None
         self._process: Optional[subprocess.Popen] = None
+        self._ps_proc: Optional[psutil.Process] = None
         self._stop_event = threading.Event()
         self._lock = threading.Lock()
-        self._base_env = os.environ.copy()
+        self._launch_env: Dict[str, str] = {}
+        self.refresh_env()
 
     # ------------------------------------------------------------------
     # Public API
@@ -56,6 +67,10 @@ class ProcessRunner:
             self.status.pid = None
             self._notify_status()
 
+    def refresh_env(self) -> None:
+        """Rebuild the launch environment after the profile environment changed."""
+        self._launch_env = {**_BASE_ENV, **self.profile.environment}
+
     def restart(self) -> None:
         self.stop()
         self.start()
@@ -66,12 +81,14 @@ class ProcessRunner:
 
     def get_resource_usage(self) -> Dict[str, float | int | None]:
         proc = self._process
-        if proc is None or proc.poll() is not None:
+        ps_proc = self._ps_proc
+        if proc is None or ps_proc is None or proc.poll() is not None:
             return {"cpu_percent": None, "memory_mb": None}
         try:
-            ps_proc = psutil.Process(proc.pid)
-            cpu = ps_proc.cpu_percent(interval=0.0)
-            mem = ps_proc.memory_info().rss / (1024 * 1024)
+            # Reusing the Process object keeps cpu_percent's sampling baseline.
+            with ps_proc.oneshot():
+                cpu = ps_proc.cpu_percent(interval=None)
+                mem = ps_proc.memory_info().rss / (1024 * 1024)
             return {"cpu_percent": cpu, "memory_mb": mem}
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             return {"cpu_percent": None, "memory_mb": None}
@@ -83,8 +100,8 @@ class ProcessRunner:
         restart_attempts = 0
         profile = self.profile
         self.status.restarts = 0
-        if profile.start_delay > 0:
-            time.sleep(profile.start_delay)
+        if profile.start_delay > 0 and self._stop_event.wait(profile.start_delay):
+            return
         while not self._stop_event.is_set():
             try:
                 self._update_state(ProcessState.STARTING)
@@ -93,10 +110,14 @@ class ProcessRunner:
                     self._update_failure("Failed to launch process")
                     break
                 self._process = process
+                self._ps_proc = self._track_process(process.pid)
                 self.status.pid = process.pid
                 self.status.start_time = time.time()
                 self._update_state(ProcessState.RUNNING)
                 return_code = process.wait()
+                # The manager may swap in an updated profile while the process runs.
+                profile = self.profile
+                self._ps_proc = None
                 self.status.last_exit_code = return_code
                 self.status.pid = None
                 if self._stop_event.is_set():
@@ -111,16 +132,24 @@ class ProcessRunner:
                     self._update_failure("Reached max restart attempts")
                     break
                 self._update_state(ProcessState.RESTARTING)
-                if profile.restart_delay > 0:
-                    waited = 0.0
-                    while waited < profile.restart_delay and not self._stop_event.is_set():
-                        time.sleep(min(0.5, profile.restart_delay - waited))
-                        waited += 0.5
+                if profile.restart_delay > 0 and self._stop_event.wait(profile.restart_delay):
+                    break
                 continue
             except Exception as exc:  # pylint: disable=broad-except
                 self._update_failure(str(exc))
                 break
         self._process = None
+        self._ps_proc = None
+
+    @staticmethod
+    def _track_process(pid: int) -> Optional[psutil.Process]:
+        try:
+            ps_proc = psutil.Process(pid)
+            # The first call only records the baseline for later deltas.
+            ps_proc.cpu_percent(interval=None)
+            return ps_proc
+        except psutil.Error:
+            return None
 
     def _launch_process(self) -> Optional[subprocess.Popen]:
         profile = self.profile
@@ -128,13 +157,12 @@ class ProcessRunner:
         if not script_path.exists():
             raise FileNotFoundError(f"Script not found: {script_path}")
         log_path = Path(profile.log_path) if profile.log_path else None
-        log_file = subprocess.DEVNULL
+        log_fd: Optional[int] = None
         if log_path:
             log_path.parent.mkdir(parents=True, exist_ok=True)
-            log_file = open(log_path, "ab", buffering=0)
+            # A raw fd is all Popen needs; skip building a Python file object.
+            log_fd = os.open(str(log_path), os.O_WRONLY | os.O_CREAT | os.O_APPEND | os.O_CLOEXEC, 0o644)
         try:
-            env = self._base_env.copy()
-            env.update(profile.environment)
             command = ["/bin/bash", str(script_path)]
             if os.access(script_path, os.X_OK) and script_path.is_file():
                 # Allow executable scripts without forcing bash.
@@ -142,16 +170,16 @@ class ProcessRunner:
             process = subprocess.Popen(
                 command,
                 cwd=profile.working_dir or str(script_path.parent),
-                env=env,
-                stdout=log_file,
+                env=self._launch_env,
+                stdout=subprocess.DEVNULL if log_fd is None else log_fd,
                 stderr=subprocess.STDOUT,
                 start_new_session=True,
             )
             return process
         finally:
-            if hasattr(log_file, "close"):
-                # Keep the file open by the subprocess; close the handle in parent.
-                log_file.close()
+            if log_fd is not None:
+                # The child holds its own dup of the fd; close the parent's copy.
+                os.close(log_fd)
 
     def _update_state(self, state: ProcessState) -> None:
         self.status.state = state
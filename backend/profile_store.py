@@ -6,7 +6,7 @@ import json
 from pathlib import Path
 from typing import Dict, Iterable, List
 
-from .models import ScriptProfile
+from .models import _KNOWN_DIRS, ScriptProfile, decode_json, encode_json
 
 
 class ProfileStore:
@@ -15,6 +15,7 @@ class ProfileStore:
     def __init__(self, base_dir: Path | None = None) -> None:
         self.base_dir = base_dir or Path.home() / ".local/share/run_sh_manager"
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        _KNOWN_DIRS.add(self.base_dir)
         self._store_path = self.base_dir / "profiles.json"
 
     @property
@@ -22,13 +23,15 @@ class ProfileStore:
         return self._store_path
 
     def load_profiles(self) -> List[ScriptProfile]:
-        if not self._store_path.exists():
+        try:
+            data = self._store_path.read_bytes()
+        except FileNotFoundError:
             return []
         try:
-            raw = json.loads(self._store_path.read_text(encoding="utf-8"))
+            raw = decode_json(data)
         except json.JSONDecodeError:
             backup_path = self._store_path.with_suffix(".bak")
-            backup_path.write_bytes(self._store_path.read_bytes())
+            backup_path.write_bytes(data)
             raise
         profiles = []
         for item in raw:
@@ -43,5 +46,5 @@ class ProfileStore:
             profile.ensure_paths(self.base_dir)
             serializable.append(profile.to_dict())
         temp_path = self._store_path.with_suffix(".tmp")
-        temp_path.write_text(json.dumps(serializable, indent=2, ensure_ascii=False), encoding="utf-8")
+        temp_path.write_bytes(encode_json(serializable))
         temp_path.replace(self._store_path)
@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import codecs
+import os
 from pathlib import Path
+from typing import Optional
+
 from PySide6.QtCore import QTimer
+from PySide6.QtGui import QTextCursor
 from PySide6.QtWidgets import (
     QCheckBox,
     QDialog,
@@ -16,18 +21,30 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
 )
 
+# Only the last part of a large log is loaded; older lines are dropped.
+TAIL_BYTES = 1 << 20
+MAX_BLOCKS = 20000
+
 
 class LogViewerDialog(QDialog):
     """Simple dialog that tails a log file."""
 
+    # Polling backs off exponentially while the log is idle.
+    MIN_INTERVAL_MS = 1000
+    MAX_INTERVAL_MS = 10000
+
     def __init__(self, log_path: Path, parent=None) -> None:
         super().__init__(parent)
         self.setWindowTitle(f"ログビューア - {log_path.name}")
         self._log_path = log_path
         self._auto_refresh = True
         self._last_size = 0
+        self._idle_streak = 0
+        self._fd: Optional[int] = None
+        self._missing = False
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
         self._timer = QTimer(self)
-        self._timer.setInterval(1000)
+        self._timer.setInterval(self.MIN_INTERVAL_MS)
         self._timer.timeout.connect(self._refresh)
         self._build_ui()
         self._refresh(initial=True)
@@ -49,6 +66,7 @@ class LogViewerDialog(QDialog):
 
         self.text_edit = QPlainTextEdit()
         self.text_edit.setReadOnly(True)
+        self.text_edit.setMaximumBlockCount(MAX_BLOCKS)
         main_layout.addWidget(self.text_edit)
 
         button_box = QDialogButtonBox(QDialogButtonBox.Close)
@@ -59,6 +77,7 @@ class LogViewerDialog(QDialog):
     def _toggle_auto_refresh(self, state: int) -> None:
         self._auto_refresh = state != 0
         if self._auto_refresh:
+            self._reset_interval()
             self._timer.start()
         else:
             self._timer.stop()
@@ -66,21 +85,101 @@ class LogViewerDialog(QDialog):
     def _refresh(self, initial: bool = False) -> None:
         if not self._auto_refresh and not initial:
             return
-        if not self._log_path.exists():
-            self.text_edit.setPlainText("ログファイルが見つかりません。")
+        try:
+            on_disk = os.stat(self._log_path)
+        except OSError:
+            self._show_missing(initial)
             return
-        data = self._log_path.read_bytes()
-        if len(data) == self._last_size and not initial:
+        if self._fd is not None:
+            current = os.fstat(self._fd)
+            if (current.st_ino, current.st_dev) != (on_disk.st_ino, on_disk.st_dev):
+                # The log was rotated or replaced; follow the file at the path.
+                self._close_log()
+        if self._fd is None and not self._open_log():
+            self._show_missing(initial)
             return
-        self._last_size = len(data)
-        text = data.decode("utf-8", errors="replace")
-        self.text_edit.setPlainText(text)
-        self.text_edit.verticalScrollBar().setValue(self.text_edit.verticalScrollBar().maximum())
+        size = os.fstat(self._fd).st_size
+        if size < self._last_size:
+            # The log was truncated or rotated; start over from the beginning.
+            if not self._open_log():
+                return
+            size = os.fstat(self._fd).st_size
+        if size == self._last_size:
+            if not initial:
+                self._back_off()
+            return
+        self._reset_interval()
+        scroll_bar = self.text_edit.verticalScrollBar()
+        # Only follow the tail if the user has not scrolled up to read.
+        follow = initial or scroll_bar.value() >= scroll_bar.maximum() - 4
+        start = max(self._last_size, size - TAIL_BYTES)
+        chunk = os.pread(self._fd, size - start, start)
+        if start > self._last_size:
+            # Skip the partial first line of the tail.
+            self.text_edit.clear()
+            self._decoder.reset()
+            self._last_size = start + len(chunk)
+            chunk = chunk[chunk.find(b"\n") + 1 :]
+        else:
+            self._last_size += len(chunk)
+        self._append_text(self._decoder.decode(chunk))
+        if follow:
+            scroll_bar.setValue(scroll_bar.maximum())
+
+    def _show_missing(self, initial: bool) -> None:
+        self._close_log()
+        if not self._missing:
+            self._missing = True
+            self.text_edit.setPlainText("ログファイルが見つかりません。")
+        if not initial:
+            self._back_off()
+
+    def _back_off(self) -> None:
+        self._idle_streak += 1
+        interval = min(self.MAX_INTERVAL_MS, self.MIN_INTERVAL_MS << min(self._idle_streak, 4))
+        if interval != self._timer.interval():
+            self._timer.setInterval(interval)
+
+    def _reset_interval(self) -> None:
+        self._idle_streak = 0
+        if self._timer.interval() != self.MIN_INTERVAL_MS:
+            self._timer.setInterval(self.MIN_INTERVAL_MS)
+
+    def _append_text(self, text: str) -> None:
+        # Insert at the end instead of appendPlainText so partial lines are continued.
+        cursor = QTextCursor(self.text_edit.document())
+        cursor.movePosition(QTextCursor.End)
+        cursor.insertText(text)
+
+    def _open_log(self) -> bool:
+        """(Re)open the log file and reset the viewer state."""
+        self._close_log()
+        self._last_size = 0
+        self._decoder.reset()
+        self.text_edit.clear()
+        try:
+            self._fd = os.open(str(self._log_path), os.O_RDONLY | os.O_NONBLOCK)
+        except OSError:
+            return False
+        self._missing = False
+        return True
+
+    def _close_log(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
 
     def _open_other_file(self) -> None:
         path, _ = QFileDialog.getOpenFileName(self, "ログファイルを開く")
         if path:
+            self._close_log()
+            self._missing = False
             self._log_path = Path(path)
             self.setWindowTitle(f"ログビューア - {self._log_path.name}")
             self._last_size = 0
             self._refresh(initial=True)
+
+    def done(self, result: int) -> None:
+        self._timer.stop()
+        self._close_log()
+        super().done(result)
@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-import json
+import re
 import traceback
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Set
 
-from PySide6.QtCore import Qt, QTimer, QUrl
-from PySide6.QtGui import QAction, QCloseEvent, QDesktopServices
+from PySide6.QtCore import QEvent, QItemSelectionModel, Qt, QThread, QTimer, QUrl, Signal
+from PySide6.QtGui import QAction, QCloseEvent, QDesktopServices, QHideEvent, QShowEvent
 from PySide6.QtWidgets import (
     QDialog,
     QFileDialog,
@@ -16,35 +16,24 @@ from PySide6.QtWidgets import (
     QLabel,
     QMainWindow,
     QMessageBox,
+    QAbstractItemView,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QToolBar,
     QVBoxLayout,
     QWidget,
 )
 
 from ..backend.manager import ScriptManager
-from ..backend.models import ProcessStatus, ScriptProfile
-from .log_viewer import LogViewerDialog
-from .profile_dialog import ProfileDialog
+from ..backend.models import ProcessState, ProcessStatus, ScriptProfile, decode_json, encode_json
+from .profile_model import ProfileTableModel
+from .sampler import SamplerWorker
 
 
 class MainWindow(QMainWindow):
     """Primary GUI for interacting with the ScriptManager."""
 
-    columns = [
-        "名前",
-        "状態",
-        "PID",
-        "CPU%",
-        "メモリ(MB)",
-        "自動起動",
-        "再起動待機(s)",
-        "起動遅延(s)",
-        "再起動回数",
-        "最終終了コード",
-    ]
+    samplingRequested = Signal(bool)
 
     def __init__(self) -> None:
         super().__init__()
@@ -56,10 +45,19 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "初期化エラー", f"プロファイルの読み込みに失敗しました:\n{exc}")
             raise
         self._build_ui()
-        self._status_timer = QTimer(self)
-        self._status_timer.setInterval(1000)
-        self._status_timer.timeout.connect(self.refresh_profiles)
-        self._status_timer.start()
+        # Rows are refreshed when the backend reports a status change; CPU/memory
+        # are sampled on a worker thread, and only while something is running.
+        self._pending_rows: Set[str] = set()
+        self._sampling = False
+        self._sampler_active = False
+        self._sampler_thread = QThread(self)
+        self._sampler = SamplerWorker(self.manager)
+        self._sampler.moveToThread(self._sampler_thread)
+        self._sampler_thread.finished.connect(self._sampler.deleteLater)
+        self._sampler.sampled.connect(self._apply_usage)
+        self.samplingRequested.connect(self._sampler.set_active)
+        self._sampler_thread.start()
+        self.manager.register_listener(self._on_status_changed)
         self.refresh_profiles()
         self.manager.start_auto_profiles()
 
@@ -73,12 +71,12 @@ class MainWindow(QMainWindow):
         layout = QVBoxLayout(central)
         layout.setContentsMargins(6, 6, 6, 6)
         layout.addWidget(QLabel("管理するスクリプト一覧"))
-        self.table = QTableWidget()
-        self.table.setColumnCount(len(self.columns))
-        self.table.setHorizontalHeaderLabels(self.columns)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.table.setSelectionMode(QTableWidget.SingleSelection)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.model = ProfileTableModel(self.manager, self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.table.horizontalHeader().setStretchLastSection(True)
         layout.addWidget(self.table)
 
@@ -151,63 +149,67 @@ class MainWindow(QMainWindow):
     # Table helpers
     # ------------------------------------------------------------------
     def refresh_profiles(self) -> None:
-        selected_name = self._selected_profile_name()
-        profiles = self.manager.get_profiles()
-        self.table.setRowCount(len(profiles))
-        for row, profile in enumerate(profiles):
-            status = self.manager.get_status(profile.name) or ProcessStatus(name=profile.name)
-            usage = self.manager.get_resource_usage(profile.name)
-            cpu_text = "--" if usage["cpu_percent"] is None else f"{usage['cpu_percent']:.1f}"
-            mem_text = "--" if usage["memory_mb"] is None else f"{usage['memory_mb']:.1f}"
-            values = [
-                profile.name,
-                status.state.value,
-                str(status.pid or ""),
-                cpu_text,
-                mem_text,
-                "はい" if profile.auto_start else "いいえ",
-                f"{profile.restart_delay:.1f}",
-                f"{profile.start_delay:.1f}",
-                str(status.restarts),
-                "" if status.last_exit_code is None else str(status.last_exit_code),
-            ]
-            for col, value in enumerate(values):
-                item = QTableWidgetItem(value)
-                if col == 0:
-                    item.setData(Qt.UserRole, profile.name)
-                if col == 1:
-                    item.setData(Qt.UserRole + 1, status.state.value)
-                self.table.setItem(row, col, item)
-        self._restore_selection(selected_name)
+        # The model only signals changed cells; the selection is kept by Qt.
+        self.model.refresh()
+
+    def _on_status_changed(self, status: ProcessStatus) -> None:
+        if status.state == ProcessState.RUNNING:
+            self._set_sampling(True)
+        self._queue_row(status.name)
+
+    def _queue_row(self, name: str) -> None:
+        if not self._pending_rows:
+            # Coalesce bursts of updates into one pass on the next event loop turn.
+            QTimer.singleShot(0, self._flush_pending_rows)
+        self._pending_rows.add(name)
+
+    def _recheck_row_later(self, name: str) -> None:
+        # Runners report transitions themselves; this only catches a missed
+        # update and touches a single row, which is a no-op when unchanged.
+        QTimer.singleShot(500, lambda: self._queue_row(name))
+
+    def _flush_pending_rows(self) -> None:
+        names, self._pending_rows = self._pending_rows, set()
+        self.model.refresh_rows(names)
+
+    def _apply_usage(self, usage: Dict[str, Dict[str, float | int | None]]) -> None:
+        if not self.model.refresh_usage(usage):
+            self._set_sampling(False)
+
+    def _set_sampling(self, wanted: bool) -> None:
+        self._sampling = wanted
+        self._update_sampler()
+
+    def _update_sampler(self) -> None:
+        # Nobody sees the usage columns while the window is hidden or minimized.
+        active = self._sampling and self.isVisible() and not self.isMinimized()
+        if active != self._sampler_active:
+            self._sampler_active = active
+            self.samplingRequested.emit(active)
 
     def _selected_profile_name(self) -> Optional[str]:
-        row = self.table.currentRow()
-        if row < 0:
+        index = self.table.currentIndex()
+        if not index.isValid():
             return None
-        item = self.table.item(row, 0)
-        if not item:
-            return None
-        return item.data(Qt.UserRole) or item.text()
+        return self.model.profile_name(index.row())
 
-    def _restore_selection(self, name: Optional[str]) -> None:
-        if not name:
-            return
-        for row in range(self.table.rowCount()):
-            item = self.table.item(row, 0)
-            if item and (item.data(Qt.UserRole) == name or item.text() == name):
-                self.table.selectRow(row)
-                break
+    def _select_profile(self, name: str) -> None:
+        index = self.model.index_of(name)
+        if index.isValid():
+            self.table.selectionModel().setCurrentIndex(
+                index, QItemSelectionModel.ClearAndSelect | QItemSelectionModel.Rows
+            )
 
     def _get_profile_by_name(self, name: str) -> Optional[ScriptProfile]:
-        for profile in self.manager.get_profiles():
-            if profile.name == name:
-                return profile
-        return None
+        return self.manager.get_profile(name)
 
     # ------------------------------------------------------------------
     # Actions
     # ------------------------------------------------------------------
     def _add_profile(self) -> None:
+        # Dialog modules are imported on first use to keep them off the startup path.
+        from .profile_dialog import ProfileDialog
+
         dialog = ProfileDialog(self)
         if dialog.exec() == QDialog.Accepted:
             profile = dialog.get_profile()
@@ -215,6 +217,7 @@ class MainWindow(QMainWindow):
                 try:
                     self.manager.add_profile(profile)
                     self.refresh_profiles()
+                    self._select_profile(profile.name)
                 except Exception as exc:  # pylint: disable=broad-except
                     QMessageBox.warning(self, "追加エラー", str(exc))
 
@@ -226,6 +229,8 @@ class MainWindow(QMainWindow):
         profile = self._get_profile_by_name(name)
         if not profile:
             return
+        from .profile_dialog import ProfileDialog
+
         dialog = ProfileDialog(self, profile=profile)
         if dialog.exec() == QDialog.Accepted:
             updated = dialog.get_profile()
@@ -233,6 +238,7 @@ class MainWindow(QMainWindow):
                 try:
                     self.manager.update_profile(name, updated)
                     self.refresh_profiles()
+                    self._select_profile(updated.name)
                 except Exception as exc:  # pylint: disable=broad-except
                     QMessageBox.warning(self, "更新エラー", str(exc))
 
@@ -250,7 +256,7 @@ class MainWindow(QMainWindow):
         name = self._selected_profile_name()
         if name:
             self.manager.start_profile(name)
-            QTimer.singleShot(500, self.refresh_profiles)
+            self._recheck_row_later(name)
 
     def _stop_selected(self) -> None:
         name = self._selected_profile_name()
@@ -263,13 +269,13 @@ class MainWindow(QMainWindow):
                 QMessageBox.No,
             ) == QMessageBox.Yes
             self.manager.stop_profile(name, force=force)
-            QTimer.singleShot(500, self.refresh_profiles)
+            self._recheck_row_later(name)
 
     def _restart_selected(self) -> None:
         name = self._selected_profile_name()
         if name:
             self.manager.restart_profile(name)
-            QTimer.singleShot(500, self.refresh_profiles)
+            self._recheck_row_later(name)
 
     def _view_log(self) -> None:
         name = self._selected_profile_name()
@@ -280,6 +286,8 @@ class MainWindow(QMainWindow):
         if not profile or not profile.log_path:
             QMessageBox.information(self, "ログなし", "ログファイルが設定されていません。")
             return
+        from .log_viewer import LogViewerDialog
+
         dialog = LogViewerDialog(Path(profile.log_path), parent=self)
         dialog.exec()
 
@@ -292,20 +300,29 @@ class MainWindow(QMainWindow):
         if not path:
             return
         try:
-            from ..backend.models import ScriptProfile
-
-            data = json.loads(Path(path).read_text(encoding="utf-8"))
+            data = decode_json(Path(path).read_bytes())
+            existing = {profile.name for profile in self.manager.get_profiles()}
+            # base name -> next suffix to try, seeded past the highest one in use.
+            next_suffix: Dict[str, int] = {}
+            profiles = []
             for item in data:
                 profile = ScriptProfile.from_dict(item)
-                base_name = profile.name
-                suffix = 1
-                while True:
-                    try:
-                        self.manager.add_profile(profile)
-                        break
-                    except ValueError:
-                        profile.name = f"{base_name}_{suffix}"
+                if profile.name in existing:
+                    base_name = profile.name
+                    suffix = next_suffix.get(base_name)
+                    if suffix is None:
+                        pattern = re.compile(rf"{re.escape(base_name)}_(\d+)")
+                        suffix = 1 + max(
+                            (int(match.group(1)) for name in existing if (match := pattern.fullmatch(name))),
+                            default=0,
+                        )
+                    while f"{base_name}_{suffix}" in existing:
                         suffix += 1
+                    profile.name = f"{base_name}_{suffix}"
+                    next_suffix[base_name] = suffix + 1
+                existing.add(profile.name)
+                profiles.append(profile)
+            self.manager.add_profiles(profiles)
         except Exception as exc:  # pylint: disable=broad-except
             QMessageBox.warning(self, "読み込みエラー", str(exc))
         self.refresh_profiles()
@@ -316,7 +333,7 @@ class MainWindow(QMainWindow):
             return
         try:
             profiles = [profile.to_dict() for profile in self.manager.get_profiles()]
-            Path(path).write_text(json.dumps(profiles, indent=2, ensure_ascii=False), encoding="utf-8")
+            Path(path).write_bytes(encode_json(profiles))
         except Exception as exc:  # pylint: disable=broad-except
             QMessageBox.warning(self, "書き出しエラー", str(exc))
 
@@ -349,11 +366,24 @@ X-GNOME-Autostart-enabled=true
     # ------------------------------------------------------------------
     # Events
     # ------------------------------------------------------------------
+    def showEvent(self, event: QShowEvent) -> None:  # noqa: N802
+        super().showEvent(event)
+        self.refresh_profiles()
+        self._update_sampler()
+
+    def hideEvent(self, event: QHideEvent) -> None:  # noqa: N802
+        super().hideEvent(event)
+        self._update_sampler()
+
+    def changeEvent(self, event: QEvent) -> None:  # noqa: N802
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            if not self.isMinimized():
+                # Catch up on anything that changed while minimized.
+                self.refresh_profiles()
+            self._update_sampler()
+
     def closeEvent(self, event: QCloseEvent) -> None:  # noqa: N802
-        try:
-            self.manager.save()
-        except Exception:  # pragma: no cover - best effort
-            traceback.print_exc()
         reply = QMessageBox.question(
             self,
             "終了確認",
@@ -364,6 +394,13 @@ X-GNOME-Autostart-enabled=true
         if reply == QMessageBox.Cancel:
             event.ignore()
             return
+        try:
+            # Writes only if an edit is still waiting for the debounced save.
+            self.manager.flush()
+        except Exception:  # pragma: no cover - best effort
+            traceback.print_exc()
         if reply == QMessageBox.Yes:
             self.manager.stop_all()
+        self._sampler_thread.quit()
+        self._sampler_thread.wait()
         event.accept()
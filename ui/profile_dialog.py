@@ -26,20 +26,17 @@ from PySide6.QtWidgets import (
 from ..backend.models import ScriptProfile
 
 
-def _dict_to_env_text(environment: dict[str, str]) -> str:
-    return "\n".join(f"{key}={value}" for key, value in environment.items())
-
-
 def _env_text_to_dict(text: str) -> dict[str, str]:
     env: dict[str, str] = {}
     for line in text.splitlines():
         striped = line.strip()
-        if not striped or striped.startswith("#"):
+        if not striped or striped[0] == "#":
             continue
-        if "=" not in striped:
+        key, sep, value = striped.partition("=")
+        if not sep:
             raise ValueError(f"環境変数の形式が正しくありません: '{striped}'")
-        key, value = striped.split("=", 1)
-        env[key.strip()] = value.strip()
+        # The line is already stripped, so only the inner sides need trimming.
+        env[key.rstrip()] = value.lstrip()
     return env
 
 
@@ -117,7 +114,7 @@ class ProfileDialog(QDialog):
         self.env_edit = QPlainTextEdit()
         self.env_edit.setPlaceholderText("KEY=value 形式で1行ごとに入力")
         if profile:
-            self.env_edit.setPlainText(_dict_to_env_text(profile.environment))
+            self.env_edit.setPlainText(profile.env_text)
         layout.addRow(QLabel("環境変数"))
         layout.addRow(self.env_edit)
 
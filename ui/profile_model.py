@@ -0,0 +1,243 @@
+"""Table model exposing script profiles and their runtime status."""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QObject, Qt
+
+from ..backend.manager import ScriptManager
+from ..backend.models import ProcessState, ProcessStatus, ScriptProfile
+
+Row = Tuple[str, ...]
+Usage = Dict[str, float | int | None]
+# Raw status/usage values the dynamic cells are formatted from.
+RowKey = Tuple[object, ...]
+
+# Columns that only change when the profile itself is edited; the others
+# (state, PID, CPU%, memory, restarts, exit code) follow the process.
+STATIC_COLUMNS = (0, 5, 6, 7)
+_NO_USAGE: Usage = {"cpu_percent": None, "memory_mb": None}
+
+
+class ProfileTableModel(QAbstractTableModel):
+    """Read-only model over the ScriptManager's profiles.
+
+    ``refresh`` re-reads the manager and notifies views only about rows and
+    cells that actually changed, so persistent indexes (and with them the
+    view's selection) survive periodic updates.
+    """
+
+    columns = [
+        "名前",
+        "状態",
+        "PID",
+        "CPU%",
+        "メモリ(MB)",
+        "自動起動",
+        "再起動待機(s)",
+        "起動遅延(s)",
+        "再起動回数",
+        "最終終了コード",
+    ]
+
+    def __init__(self, manager: ScriptManager, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._manager = manager
+        self._names: List[str] = []
+        self._rows: List[Row] = []
+        # name -> row, rebuilt only when rows are inserted, removed or moved.
+        self._row_index: Dict[str, int] = {}
+        # name -> (source, formatted cells) for the static and dynamic column groups.
+        self._static: Dict[str, Tuple[ScriptProfile, Row]] = {}
+        self._dynamic: Dict[str, Tuple[RowKey, Row]] = {}
+
+    # ------------------------------------------------------------------
+    # Qt model interface
+    # ------------------------------------------------------------------
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802
+        return 0 if parent.isValid() else len(self.columns)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):  # noqa: N802
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.columns[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        if role == Qt.UserRole:
+            return self._names[index.row()]
+        return None
+
+    # ------------------------------------------------------------------
+    # Lookup helpers
+    # ------------------------------------------------------------------
+    def profile_name(self, row: int) -> Optional[str]:
+        if 0 <= row < len(self._names):
+            return self._names[row]
+        return None
+
+    def row_of(self, name: str) -> int:
+        return self._row_index.get(name, -1)
+
+    def index_of(self, name: str, column: int = 0) -> QModelIndex:
+        row = self.row_of(name)
+        return self.index(row, column) if row >= 0 else QModelIndex()
+
+    # ------------------------------------------------------------------
+    # Refresh
+    # ------------------------------------------------------------------
+    def refresh(self) -> None:
+        """Re-read every profile; used after profiles are added, edited or removed."""
+        snapshot = self._manager.snapshot()
+        names = list(snapshot)
+        rows = [self._row_for(*entry) for entry in snapshot.values()]
+        if names != self._names:
+            self._sync_rows(names, rows)
+            for cache in (self._static, self._dynamic):
+                for name in cache.keys() - snapshot.keys():
+                    del cache[name]
+        for row, new in enumerate(rows):
+            self._set_row(row, new)
+
+    def refresh_rows(self, names: Iterable[str]) -> None:
+        """Update the dynamic columns of the given profiles, e.g. after their status changed."""
+        for name in names:
+            row = self.row_of(name)
+            if row >= 0:
+                status = self._manager.get_status(name) or ProcessStatus(name=name)
+                self._refresh_dynamic(row, status, self._manager.cached_usage(name))
+
+    def refresh_usage(self, usage: Dict[str, Usage]) -> bool:
+        """Apply a usage sweep to the dynamic columns; return True while any script runs."""
+        running = False
+        for row, name in enumerate(self._names):
+            status = self._manager.get_status(name) or ProcessStatus(name=name)
+            if status.state == ProcessState.RUNNING:
+                running = True
+            self._refresh_dynamic(row, status, usage.get(name, _NO_USAGE))
+        return running
+
+    def _refresh_dynamic(self, row: int, status: ProcessStatus, usage: Usage) -> None:
+        # Rows are always built from the cached cells, so a cache hit means
+        # the row is already up to date and the static cells are left alone.
+        previous = self._dynamic.get(status.name)
+        cells = self._dynamic_cells(status, usage)
+        if previous is None or cells is not previous[1]:
+            self._set_row(row, self._join(self._static_of(self._rows[row]), cells))
+
+    def _row_for(self, profile: ScriptProfile, status: ProcessStatus, usage: Usage) -> Row:
+        return self._join(self._static_cells(profile), self._dynamic_cells(status, usage))
+
+    def _static_cells(self, profile: ScriptProfile) -> Row:
+        """Return the static cells, reformatted only when the profile object changed."""
+        cached = self._static.get(profile.name)
+        if cached is not None and cached[0] == profile:
+            return cached[1]
+        cells = (
+            profile.name,
+            "はい" if profile.auto_start else "いいえ",
+            profile.restart_delay_text,
+            profile.start_delay_text,
+        )
+        self._static[profile.name] = (profile, cells)
+        return cells
+
+    def _dynamic_cells(self, status: ProcessStatus, usage: Usage) -> Row:
+        """Return the dynamic cells, reformatted only when a raw value changed."""
+        if status.state != ProcessState.RUNNING:
+            # A sweep taken before the process stopped may still be cached.
+            usage = _NO_USAGE
+        key = (
+            status.state,
+            status.pid,
+            status.restarts,
+            status.last_exit_code,
+            usage["cpu_percent"],
+            usage["memory_mb"],
+        )
+        cached = self._dynamic.get(status.name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        cpu_text, mem_text = self._format_usage(usage)
+        cells = (
+            status.state.value,
+            str(status.pid or ""),
+            cpu_text,
+            mem_text,
+            str(status.restarts),
+            "" if status.last_exit_code is None else str(status.last_exit_code),
+        )
+        self._dynamic[status.name] = (key, cells)
+        return cells
+
+    @staticmethod
+    def _join(static: Row, dynamic: Row) -> Row:
+        return (static[0], *dynamic[:4], *static[1:], *dynamic[4:])
+
+    @staticmethod
+    def _static_of(row: Row) -> Row:
+        return tuple(row[col] for col in STATIC_COLUMNS)
+
+    def _set_row(self, row: int, new: Row) -> None:
+        old = self._rows[row]
+        if old is new or old == new:
+            return
+        changed = [col for col in range(len(new)) if old[col] != new[col]]
+        self._rows[row] = new
+        self.dataChanged.emit(self.index(row, changed[0]), self.index(row, changed[-1]), [Qt.DisplayRole])
+
+    def _sync_rows(self, names: List[str], rows: List[Row]) -> None:
+        """Apply row insertions/removals so that the row order matches *names*."""
+        wanted = set(names)
+        if len(names) == len(self._names) and not wanted & {
+            old for old, new in zip(self._names, names) if old != new
+        }:
+            # Renamed in place: rows keep their positions, only the names change.
+            self._names = list(names)
+            self._reindex()
+            return
+        for row in reversed(range(len(self._names))):
+            if self._names[row] not in wanted:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._names[row]
+                del self._rows[row]
+                self._reindex()
+                self.endRemoveRows()
+        kept = len(self._names)
+        if self._names == names[:kept]:
+            if kept < len(names):
+                self.beginInsertRows(QModelIndex(), kept, len(names) - 1)
+                self._names.extend(names[kept:])
+                self._rows.extend(rows[kept:])
+                self._reindex()
+                self.endInsertRows()
+            return
+        # Order changed (e.g. after a rename); move persistent indexes along.
+        self.layoutAboutToBeChanged.emit()
+        old_names = self._names
+        self._names = list(names)
+        self._rows = list(rows)
+        self._reindex()
+        old_indexes = self.persistentIndexList()
+        new_indexes = []
+        for index in old_indexes:
+            row = self.row_of(old_names[index.row()])
+            new_indexes.append(self.index(row, index.column()) if row >= 0 else QModelIndex())
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
+
+    def _reindex(self) -> None:
+        self._row_index = {name: row for row, name in enumerate(self._names)}
+
+    @staticmethod
+    def _format_usage(usage: Usage) -> Tuple[str, str]:
+        cpu_text = "--" if usage["cpu_percent"] is None else f"{usage['cpu_percent']:.1f}"
+        mem_text = "--" if usage["memory_mb"] is None else f"{usage['memory_mb']:.1f}"
+        return cpu_text, mem_text
@@ -0,0 +1,41 @@
+"""Background resource sampling for the main window."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from PySide6.QtCore import QObject, QTimer, Signal, Slot
+
+from ..backend.manager import ScriptManager
+
+
+class SamplerWorker(QObject):
+    """Periodically sample CPU/memory usage on a worker thread.
+
+    The worker is meant to be moved to its own ``QThread``; its timer is
+    created lazily so that it lives in that thread's event loop, and each
+    sweep is delivered to the GUI thread through the queued ``sampled``
+    signal.
+    """
+
+    sampled = Signal(object)
+
+    def __init__(self, manager: ScriptManager, interval_ms: int = 1000) -> None:
+        super().__init__()
+        self._manager = manager
+        self._interval_ms = interval_ms
+        self._timer: Optional[QTimer] = None
+
+    @Slot(bool)
+    def set_active(self, active: bool) -> None:
+        if self._timer is None:
+            self._timer = QTimer(self)
+            self._timer.setInterval(self._interval_ms)
+            self._timer.timeout.connect(self._sample)
+        if active and not self._timer.isActive():
+            self._timer.start()
+        elif not active:
+            self._timer.stop()
+
+    def _sample(self) -> None:
+        self.sampled.emit(self._manager.sample_all())